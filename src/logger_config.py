@@ -4,8 +4,14 @@
 переменных окружения и требований безопасности.
 """
 
+import atexit
+import functools
 import logging
+import logging.handlers
 import os
+import queue
+import threading
+from typing import List, Optional, Tuple
 
 # Константы для логирования
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
@@ -13,6 +19,64 @@ LOG_FILE = os.getenv("LOG_FILE", "app.log")
 LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 
+# Очередь, через которую записи логов передаются в фоновый поток вывода
+_LOG_QUEUE: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+
+# Обработчики вывода, общие для всех логгеров (создаются один раз на процесс)
+_output_handlers: List[logging.Handler] = []
+
+# Фоновый слушатель очереди и блокировка, защищающая его запуск и остановку
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+_LISTENER_LOCK = threading.RLock()
+
+# Соответствие названий уровней логирования их числовым значениям
+# (заранее включены варианты в верхнем, нижнем и смешанном регистре)
+_LEVEL_MAPPING = {
+    variant: level
+    for name, level in (
+        ("DEBUG", logging.DEBUG),
+        ("INFO", logging.INFO),
+        ("WARNING", logging.WARNING),
+        ("ERROR", logging.ERROR),
+        ("CRITICAL", logging.CRITICAL),
+    )
+    for variant in (name, name.lower(), name.title())
+}
+
+
+class _CachedTimeFormatter(logging.Formatter):
+    """Форматтер, который переиспользует строку времени в пределах одной секунды."""
+
+    # Секунда и строка времени хранятся одним кортежем, чтобы их чтение и
+    # запись были атомарными при форматировании из нескольких потоков
+    _cached: Tuple[int, str] = (-1, "")
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        """
+        Возвращает время записи, форматируя его не чаще раза в секунду.
+
+        Args:
+            record: Запись лога
+            datefmt: Формат даты и времени
+
+        Returns:
+            Отформатированное время записи
+        """
+        if datefmt is None:
+            # Формат по умолчанию содержит миллисекунды, кэшировать его нельзя
+            return super().formatTime(record, datefmt)
+
+        second = int(record.created)
+        cached_second, cached_time = self._cached
+        if second != cached_second:
+            cached_time = super().formatTime(record, datefmt)
+            self._cached = (second, cached_time)
+        return cached_time
+
+
+# Общий форматтер для всех обработчиков
+_FORMATTER = _CachedTimeFormatter(LOG_FORMAT, datefmt=DATE_FORMAT)
+
 
 def _get_log_level(level_name: str) -> int:
     """
@@ -24,14 +88,126 @@ def _get_log_level(level_name: str) -> int:
     Returns:
         Числовое значение уровня логирования
     """
-    level_mapping = {
-        "DEBUG": logging.DEBUG,
-        "INFO": logging.INFO,
-        "WARNING": logging.WARNING,
-        "ERROR": logging.ERROR,
-        "CRITICAL": logging.CRITICAL,
-    }
-    return level_mapping.get(level_name.upper(), logging.INFO)
+    level = _LEVEL_MAPPING.get(level_name)
+    if level is None:
+        level = _LEVEL_MAPPING.get(level_name.upper(), logging.INFO)
+    return level
+
+
+class _ListenerQueueHandler(logging.handlers.QueueHandler):
+    """Обработчик очереди, который пишет напрямую, если фоновый поток остановлен."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """
+        Помещает запись в очередь или, после остановки потока, выводит ее сразу.
+
+        Args:
+            record: Запись лога
+        """
+        with _LISTENER_LOCK:
+            if _queue_listener is not None:
+                super().emit(record)
+                return
+
+        for handler in _output_handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+
+def _start_queue_listener() -> Optional[OSError]:
+    """
+    Создает обработчики вывода и запускает фоновый поток записи логов.
+
+    Обработчики создаются один раз на процесс и разделяются всеми логгерами.
+    Если файл логов недоступен, сообщения выводятся только в консоль.
+    Остановленный поток запускается заново с теми же обработчиками.
+
+    Returns:
+        Ошибка открытия файла логов, если обработчики были созданы этим
+        вызовом без файлового обработчика, иначе None
+    """
+    global _queue_listener
+
+    with _LISTENER_LOCK:
+        if _queue_listener is not None:
+            return None
+
+        file_error: Optional[OSError] = None
+        if not _output_handlers:
+            # Обработчик для файла
+            try:
+                file_handler = logging.FileHandler(LOG_FILE, encoding="utf-8")
+                file_handler.setLevel(_get_log_level(LOG_LEVEL))
+                file_handler.setFormatter(_FORMATTER)
+
+                # Обработчик для консоли (только WARNING и выше)
+                console_handler = logging.StreamHandler()
+                console_handler.setLevel(logging.WARNING)
+                console_handler.setFormatter(_FORMATTER)
+                _output_handlers.extend([file_handler, console_handler])
+            except (OSError, PermissionError) as e:
+                # Если не удалось создать файл, логируем только в консоль
+                console_handler = logging.StreamHandler()
+                console_handler.setLevel(_get_log_level(LOG_LEVEL))
+                console_handler.setFormatter(_FORMATTER)
+                _output_handlers.append(console_handler)
+                file_error = e
+
+        listener = logging.handlers.QueueListener(_LOG_QUEUE, *_output_handlers, respect_handler_level=True)
+        try:
+            listener.start()
+        except RuntimeError:
+            # При завершении интерпретатора новый поток не запустить,
+            # поэтому записи выводятся напрямую, минуя очередь
+            return file_error
+        _queue_listener = listener
+        return file_error
+
+
+def _stop_queue_listener() -> None:
+    """
+    Останавливает фоновый поток записи логов.
+
+    Перед остановкой выводятся все сообщения, оставшиеся в очереди. После
+    остановки логгеры пишут напрямую в обработчики вывода, поэтому сообщения
+    из обработчиков завершения работы не теряются. Повторный вызов ничего
+    не делает.
+    """
+    global _queue_listener
+
+    with _LISTENER_LOCK:
+        if _queue_listener is None:
+            return
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
+
+
+@functools.lru_cache(maxsize=None)
+def _configure_logger(name: str) -> logging.Logger:
+    """
+    Подключает логгер к очереди логов. Результат кэшируется по имени.
+
+    Args:
+        name: Имя логгера
+
+    Returns:
+        Логгер, передающий записи в очередь логов
+    """
+    logger = logging.getLogger(name)
+    logger.setLevel(_get_log_level(LOG_LEVEL))
+
+    # Предотвращаем дублирование обработчиков
+    if logger.handlers:
+        return logger
+
+    # Не передаем записи корневому логгеру, чтобы избежать их повторного вывода
+    logger.propagate = False
+    logger.addHandler(_ListenerQueueHandler(_LOG_QUEUE))
+
+    return logger
 
 
 def setup_logger(name: str) -> logging.Logger:
@@ -42,7 +218,10 @@ def setup_logger(name: str) -> logging.Logger:
     - LOG_LEVEL: уровень логирования (по умолчанию INFO)
     - LOG_FILE: путь к файлу логов (по умолчанию app.log)
 
-    Логгер выводит сообщения в файл и в консоль.
+    Логгер выводит сообщения в файл и в консоль. Запись выполняется в фоновом
+    потоке: логгер только помещает сообщения в очередь. Настройка логгера
+    кэшируется по имени, поэтому повторные вызовы возвращают уже настроенный
+    логгер, а фоновый поток при необходимости запускается заново.
 
     Args:
         name: Имя логгера (обычно имя модуля, например __name__)
@@ -54,34 +233,9 @@ def setup_logger(name: str) -> logging.Logger:
         >>> logger = setup_logger(__name__)
         >>> logger.info("Модуль загружен")
     """
-    logger = logging.getLogger(name)
-    logger.setLevel(_get_log_level(LOG_LEVEL))
-
-    # Предотвращаем дублирование обработчиков
-    if logger.handlers:
-        return logger
-
-    # Форматтер для сообщений
-    formatter = logging.Formatter(LOG_FORMAT, datefmt=DATE_FORMAT)
-
-    # Обработчик для файла
-    try:
-        file_handler = logging.FileHandler(LOG_FILE, encoding="utf-8")
-        file_handler.setLevel(_get_log_level(LOG_LEVEL))
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
-    except (OSError, PermissionError) as e:
-        # Если не удалось создать файл, логируем только в консоль
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(_get_log_level(LOG_LEVEL))
-        console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
-        logger.warning(f"Не удалось создать файл логов: {e}. Логирование только в консоль.")
-
-    # Обработчик для консоли (только WARNING и выше)
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(logging.WARNING)
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    file_error = _start_queue_listener()
+    logger = _configure_logger(name)
+    if file_error is not None:
+        logger.warning("Не удалось создать файл логов: %s. Логирование только в консоль.", file_error)
 
     return logger
@@ -0,0 +1,97 @@
+"""Тесты для модуля настройки логирования."""
+
+import logging
+from pathlib import Path
+from typing import Callable, Iterator
+
+import pytest
+
+import src.logger_config as logger_config
+
+
+@pytest.fixture
+def configure_logging(
+    monkeypatch: pytest.MonkeyPatch, request: pytest.FixtureRequest
+) -> Iterator[Callable[[Path], logging.Logger]]:
+    """Настраивает логгер теста с заданным путем к файлу логов."""
+    name = request.node.name
+
+    def _setup(log_file: Path) -> logging.Logger:
+        logger_config._stop_queue_listener()
+        monkeypatch.setattr(logger_config, "LOG_FILE", str(log_file))
+        monkeypatch.setattr(logger_config, "LOG_LEVEL", "INFO")
+        monkeypatch.setattr(logger_config, "_output_handlers", [])
+        return logger_config.setup_logger(name)
+
+    yield _setup
+
+    logger_config._stop_queue_listener()
+    for handler in logger_config._output_handlers:
+        handler.close()
+    logger = logging.getLogger(name)
+    for handler in logger.handlers[:]:
+        logger.removeHandler(handler)
+    logger_config._configure_logger.cache_clear()
+
+
+def test_records_reach_file_after_stop(
+    configure_logging: Callable[[Path], logging.Logger], tmp_path: Path, request: pytest.FixtureRequest
+) -> None:
+    log_file = tmp_path / "app.log"
+    logger = configure_logging(log_file)
+
+    logger.info("Сообщение в файл")
+    logger_config._stop_queue_listener()
+
+    content = log_file.read_text(encoding="utf-8")
+    assert f"{request.node.name} - INFO - Сообщение в файл" in content
+
+
+def test_console_fallback_when_file_unavailable(
+    configure_logging: Callable[[Path], logging.Logger],
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture[str],
+    request: pytest.FixtureRequest,
+) -> None:
+    logger = configure_logging(tmp_path / "missing" / "app.log")
+
+    logger.info("Сообщение в консоль")
+    logger_config._stop_queue_listener()
+
+    err = capsys.readouterr().err
+    assert f"{request.node.name} - WARNING - Не удалось создать файл логов" in err
+    assert "No such file or directory" in err
+    assert f"{request.node.name} - INFO - Сообщение в консоль" in err
+
+
+def test_console_fallback_when_log_file_is_directory(
+    configure_logging: Callable[[Path], logging.Logger],
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture[str],
+    request: pytest.FixtureRequest,
+) -> None:
+    logger = configure_logging(tmp_path)
+
+    logger.error("Сообщение об ошибке")
+    logger_config._stop_queue_listener()
+
+    err = capsys.readouterr().err
+    assert "Is a directory" in err
+    assert f"{request.node.name} - ERROR - Сообщение об ошибке" in err
+
+
+def test_logging_after_stop_writes_directly(
+    configure_logging: Callable[[Path], logging.Logger],
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture[str],
+    request: pytest.FixtureRequest,
+) -> None:
+    log_file = tmp_path / "app.log"
+    logger = configure_logging(log_file)
+
+    logger_config._stop_queue_listener()
+    logger.warning("Сообщение после остановки")
+
+    expected = f"{request.node.name} - WARNING - Сообщение после остановки"
+    assert expected in log_file.read_text(encoding="utf-8")
+    assert expected in capsys.readouterr().err